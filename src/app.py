@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 import streamlit as st
 
 from config import APP_NAME, APP_ICON, ROLE_ADMIN
-from ui.styles import apply_global_styles
+from ui.styles import apply_all_styles, apply_deferred_styles
 from ui.pages import render_login_page, render_admin_dashboard, render_employee_dashboard
 from utils.session import init_session_state
 
@@ -46,8 +46,8 @@ def main():
     # Initialize session state
     init_session_state()
 
-    # Apply global styles
-    apply_global_styles()
+    # Apply global styles (plus login styles when logged out) in one emission
+    apply_all_styles("global" if st.session_state.authenticated else "login")
 
     # Route to appropriate page
     if not st.session_state.authenticated:
@@ -59,6 +59,9 @@ def main():
         else:
             render_employee_dashboard()
 
+    # Non-critical styles go out after the page content
+    apply_deferred_styles()
+
 
 if __name__ == "__main__":
     main()
@@ -358,7 +358,7 @@ def extract_row_by_columns(
 # =============================================================================
 
 
-def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
+def extract_summary_from_pdf(pdf: pdfplumber.PDF, pdf_name: str = "") -> SummaryExtraction | None:
     """
     Extract the guarantee summary from an Assomption insurance PDF.
 
@@ -369,6 +369,128 @@ def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
     4. Extracts guarantees from the table
     5. Extracts totals (prime annuelle totale, prime mensuelle)
 
+    Args:
+        pdf: Open pdfplumber PDF object
+        pdf_name: File name used in warning messages
+
+    Returns:
+        SummaryExtraction object or None if extraction fails
+    """
+    # Step 1: Extract document date and advisor name
+    document_date = extract_document_date(pdf) or ""
+    advisor_name = extract_advisor_name(pdf) or ""
+
+    # Step 2: Find the summary page with the table
+    summary_page = None
+    for page in pdf.pages:
+        text = page.extract_text() or ""
+        if "Sommaire des garanties" in text and "Personne" in text and "assurer" in text:
+            summary_page = page
+            break
+
+    if not summary_page:
+        print(f"Warning: 'Sommaire des garanties' page not found in {pdf_name}")
+        return None
+
+    text = summary_page.extract_text() or ""
+
+    # Step 3: Extract all insured persons
+    insured_persons = parse_all_insured_persons(text)
+    if not insured_persons:
+        print(f"Warning: Could not parse insured info from {pdf_name}")
+        return None
+
+    # Step 4: Extract words and group by lines
+    words = summary_page.extract_words()
+    lines = group_words_by_line(words)
+
+    # Step 5: Process each line for guarantees and totals
+    guarantees: list[GuaranteeInfo] = []
+    total_annual_premium = ""
+    total_monthly_premium = ""
+    payment_interval = ""
+
+    in_table = False
+
+    for y in sorted(lines.keys()):
+        line_words = sorted(lines[y], key=lambda w: w["x0"])
+        full_line = " ".join([w["text"] for w in line_words])
+
+        # Start table after "Police ..." line (e.g., "Police Vie Entiere...", "Police Protection Bronze")
+        if full_line.strip().startswith("Police ") and not in_table:
+            in_table = True
+            continue
+
+        # Extract totals
+        if "Prime annuelle totale" in full_line:
+            match = re.search(r"(\d[\d\s,]*\d?\s*\$)", full_line)
+            if match:
+                total_annual_premium = match.group(1).strip()
+            continue
+
+        if full_line.strip().startswith("Prime totale"):
+            match = re.search(r"(\d[\d\s,]*\d?\s*\$)", full_line)
+            if match:
+                total_monthly_premium = match.group(1).strip()
+            continue
+
+        if "Intervalle de paiement" in full_line:
+            match = re.search(r"Intervalle de paiement\s+(\w+)", full_line)
+            if match:
+                payment_interval = match.group(1).strip()
+            continue
+
+        if not in_table:
+            continue
+
+        # Skip header lines
+        if any(h in full_line for h in [
+            "Assurance demandee", "Capital assure", "des primes", "initiale",
+            "Assurance demandée", "Capital assuré"
+        ]):
+            continue
+        if full_line.strip().startswith("sur "):
+            continue
+
+        # End at "Sommaire"
+        if full_line.strip() == "Sommaire":
+            in_table = False
+            continue
+
+        # Extract row data
+        row = extract_row_by_columns(line_words)
+        desc = row["description"].strip()
+        capital = row["capital_assure"].strip()
+        duree = row["duree_paiement"].strip()
+        prime = row["prime_annuelle"].strip()
+
+        # Check if this is a data row (has numeric values)
+        has_capital = is_numeric_amount(capital)
+        has_prime = is_numeric_amount(prime)
+
+        if desc and (has_capital or has_prime):
+            guarantees.append(GuaranteeInfo(
+                protection_name=desc,
+                capital_assure=capital,
+                duree_paiement=duree,
+                prime_annuelle=prime,
+            ))
+
+    return SummaryExtraction(
+        document_date=document_date,
+        advisor_name=advisor_name,
+        insured_persons=insured_persons,
+        guarantees=guarantees,
+        total_annual_premium=total_annual_premium,
+        total_monthly_premium=total_monthly_premium,
+        payment_interval=payment_interval,
+    )
+
+
+def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
+    """
+    Open a PDF file and extract its summary (see extract_summary_from_pdf).
+
     Args:
         pdf_path: Path to the PDF file
 
@@ -376,115 +498,7 @@ def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
         SummaryExtraction object or None if extraction fails
     """
     with pdfplumber.open(pdf_path) as pdf:
-        # Step 1: Extract document date and advisor name
-        document_date = extract_document_date(pdf) or ""
-        advisor_name = extract_advisor_name(pdf) or ""
-
-        # Step 2: Find the summary page with the table
-        summary_page = None
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            if "Sommaire des garanties" in text and "Personne" in text and "assurer" in text:
-                summary_page = page
-                break
-
-        if not summary_page:
-            print(f"Warning: 'Sommaire des garanties' page not found in {pdf_path.name}")
-            return None
-
-        text = summary_page.extract_text() or ""
-
-        # Step 3: Extract all insured persons
-        insured_persons = parse_all_insured_persons(text)
-        if not insured_persons:
-            print(f"Warning: Could not parse insured info from {pdf_path.name}")
-            return None
-
-        # Step 4: Extract words and group by lines
-        words = summary_page.extract_words()
-        lines = group_words_by_line(words)
-
-        # Step 5: Process each line for guarantees and totals
-        guarantees: list[GuaranteeInfo] = []
-        total_annual_premium = ""
-        total_monthly_premium = ""
-        payment_interval = ""
-
-        in_table = False
-
-        for y in sorted(lines.keys()):
-            line_words = sorted(lines[y], key=lambda w: w["x0"])
-            full_line = " ".join([w["text"] for w in line_words])
-
-            # Start table after "Police ..." line (e.g., "Police Vie Entiere...", "Police Protection Bronze")
-            if full_line.strip().startswith("Police ") and not in_table:
-                in_table = True
-                continue
-
-            # Extract totals
-            if "Prime annuelle totale" in full_line:
-                match = re.search(r"(\d[\d\s,]*\d?\s*\$)", full_line)
-                if match:
-                    total_annual_premium = match.group(1).strip()
-                continue
-
-            if full_line.strip().startswith("Prime totale"):
-                match = re.search(r"(\d[\d\s,]*\d?\s*\$)", full_line)
-                if match:
-                    total_monthly_premium = match.group(1).strip()
-                continue
-
-            if "Intervalle de paiement" in full_line:
-                match = re.search(r"Intervalle de paiement\s+(\w+)", full_line)
-                if match:
-                    payment_interval = match.group(1).strip()
-                continue
-
-            if not in_table:
-                continue
-
-            # Skip header lines
-            if any(h in full_line for h in [
-                "Assurance demandee", "Capital assure", "des primes", "initiale",
-                "Assurance demandée", "Capital assuré"
-            ]):
-                continue
-            if full_line.strip().startswith("sur "):
-                continue
-
-            # End at "Sommaire"
-            if full_line.strip() == "Sommaire":
-                in_table = False
-                continue
-
-            # Extract row data
-            row = extract_row_by_columns(line_words)
-            desc = row["description"].strip()
-            capital = row["capital_assure"].strip()
-            duree = row["duree_paiement"].strip()
-            prime = row["prime_annuelle"].strip()
-
-            # Check if this is a data row (has numeric values)
-            has_capital = is_numeric_amount(capital)
-            has_prime = is_numeric_amount(prime)
-
-            if desc and (has_capital or has_prime):
-                guarantees.append(GuaranteeInfo(
-                    protection_name=desc,
-                    capital_assure=capital,
-                    duree_paiement=duree,
-                    prime_annuelle=prime,
-                ))
-
-        return SummaryExtraction(
-            document_date=document_date,
-            advisor_name=advisor_name,
-            insured_persons=insured_persons,
-            guarantees=guarantees,
-            total_annual_premium=total_annual_premium,
-            total_monthly_premium=total_monthly_premium,
-            payment_interval=payment_interval,
-        )
+        return extract_summary_from_pdf(pdf, Path(pdf_path).name)
 
 
 # =============================================================================
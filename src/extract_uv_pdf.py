@@ -355,7 +355,7 @@ def extract_row_by_columns(
 # =============================================================================
 
 
-def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
+def extract_summary_from_pdf(pdf: pdfplumber.PDF, pdf_name: str = "") -> SummaryExtraction | None:
     """
     Extract the protection summary from a UV insurance PDF.
 
@@ -371,115 +371,129 @@ def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
     - Multi-line protection names are merged
 
     Args:
-        pdf_path: Path to the PDF file
+        pdf: Open pdfplumber PDF object
+        pdf_name: File name used in warning messages
 
     Returns:
         SummaryExtraction object or None if extraction fails
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        # Step 1: Extract document date and advisor name
-        document_date = extract_document_date(pdf) or ""
-        advisor_name = extract_advisor_name(pdf) or ""
-
-        # Step 2: Find the summary page
-        summary_page = None
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            if "SOMMAIRE DES PROTECTIONS ET DES PRIMES" in text:
-                summary_page = page
-                break
+    # Step 1: Extract document date and advisor name
+    document_date = extract_document_date(pdf) or ""
+    advisor_name = extract_advisor_name(pdf) or ""
+
+    # Step 2: Find the summary page
+    summary_page = None
+    for page in pdf.pages:
+        text = page.extract_text() or ""
+        if "SOMMAIRE DES PROTECTIONS ET DES PRIMES" in text:
+            summary_page = page
+            break
+
+    if not summary_page:
+        print(f"Warning: 'SOMMAIRE DES PROTECTIONS' page not found in {pdf_name}")
+        return None
 
-        if not summary_page:
-            print(f"Warning: 'SOMMAIRE DES PROTECTIONS' page not found in {pdf_path.name}")
-            return None
+    # Step 3: Extract words and group by lines
+    words = summary_page.extract_words()
+    lines = group_words_by_line(words)
+
+    # Step 4: Process each line
+    insured_info: InsuredInfo | None = None
+    protections: list[ProtectionInfo] = []
+    total_annual_premium = ""
+    total_monthly_premium = ""
+    current_protection: ProtectionInfo | None = None
+    extraction_complete = False
+
+    for y in sorted(lines.keys()):
+        if extraction_complete:
+            break
+
+        line_words = sorted(lines[y], key=lambda w: w["x0"])
+        full_line = " ".join([w["text"] for w in line_words])
+        row_text = extract_row_by_columns(line_words)
+
+        # --- Parse insured info (detected by date pattern) ---
+        if not insured_info and re.search(r"\d{4}-\d{2}-\d{2}", full_line):
+            insured_info = parse_insured_line(full_line)
+            continue
 
-        # Step 3: Extract words and group by lines
-        words = summary_page.extract_words()
-        lines = group_words_by_line(words)
+        # --- Parse "Prime totale" (marks end of extraction) ---
+        if "Prime totale" in row_text["description"]:
+            total_annual_premium = row_text["annual_premium"].strip()
+            total_monthly_premium = row_text["monthly_premium"].strip()
+            extraction_complete = True
+            continue
 
-        # Step 4: Process each line
-        insured_info: InsuredInfo | None = None
-        protections: list[ProtectionInfo] = []
-        total_annual_premium = ""
-        total_monthly_premium = ""
-        current_protection: ProtectionInfo | None = None
-        extraction_complete = False
+        # --- Skip non-relevant lines ---
+        desc = row_text["description"].strip()
+        if not desc:
+            continue
+        if desc == "Assurance individuelle":
+            continue
+        if "SOMMAIRE" in desc:
+            continue
 
-        for y in sorted(lines.keys()):
-            if extraction_complete:
-                break
+        # --- Handle detail lines (e.g., "(Primes payables jusqu'à 46 ans)") ---
+        if desc.startswith("(") and current_protection:
+            current_protection.details = desc
+            continue
 
-            line_words = sorted(lines[y], key=lambda w: w["x0"])
-            full_line = " ".join([w["text"] for w in line_words])
-            row_text = extract_row_by_columns(line_words)
-
-            # --- Parse insured info (detected by date pattern) ---
-            if not insured_info and re.search(r"\d{4}-\d{2}-\d{2}", full_line):
-                insured_info = parse_insured_line(full_line)
-                continue
-
-            # --- Parse "Prime totale" (marks end of extraction) ---
-            if "Prime totale" in row_text["description"]:
-                total_annual_premium = row_text["annual_premium"].strip()
-                total_monthly_premium = row_text["monthly_premium"].strip()
-                extraction_complete = True
-                continue
-
-            # --- Skip non-relevant lines ---
-            desc = row_text["description"].strip()
-            if not desc:
-                continue
-            if desc == "Assurance individuelle":
-                continue
-            if "SOMMAIRE" in desc:
-                continue
-
-            # --- Handle detail lines (e.g., "(Primes payables jusqu'à 46 ans)") ---
-            if desc.startswith("(") and current_protection:
-                current_protection.details = desc
-                continue
-
-            # --- Parse protection lines ---
-            amount_raw = row_text["insurance_amount"]
-            annual_raw = row_text["annual_premium"]
-            monthly_raw = row_text["monthly_premium"]
-
-            amount = normalize_amount(amount_raw)
-            annual = annual_raw.strip()
-            monthly = monthly_raw.strip()
-
-            # VALIDATION: Must have NUMERIC amount OR NUMERIC annual premium
-            has_numeric_amount = is_numeric_amount(amount)
-            has_numeric_premium = is_numeric_amount(annual)
-
-            if has_numeric_amount or has_numeric_premium:
-                # This is a valid protection row
-                current_protection = ProtectionInfo(
-                    protection_name=desc,
-                    insurance_amount=amount,
-                    annual_premium=annual,
-                    monthly_premium=monthly,
-                )
-                protections.append(current_protection)
-
-            elif current_protection and desc and not desc.startswith("("):
-                # This might be a continuation of the previous protection name
-                # (multi-line protection names like "Avenant Assurance dette...")
-                if not amount_raw and not annual_raw:
-                    current_protection.protection_name += " " + desc
-
-        if not insured_info:
-            print(f"Warning: Could not parse insured info from {pdf_path.name}")
-            return None
-
-        return SummaryExtraction(
-            document_date=document_date,
-            advisor_name=advisor_name,
-            insured=insured_info,
-            protections=protections,
-            total_annual_premium=total_annual_premium,
-            total_monthly_premium=total_monthly_premium,
-        )
+        # --- Parse protection lines ---
+        amount_raw = row_text["insurance_amount"]
+        annual_raw = row_text["annual_premium"]
+        monthly_raw = row_text["monthly_premium"]
+
+        amount = normalize_amount(amount_raw)
+        annual = annual_raw.strip()
+        monthly = monthly_raw.strip()
+
+        # VALIDATION: Must have NUMERIC amount OR NUMERIC annual premium
+        has_numeric_amount = is_numeric_amount(amount)
+        has_numeric_premium = is_numeric_amount(annual)
+
+        if has_numeric_amount or has_numeric_premium:
+            # This is a valid protection row
+            current_protection = ProtectionInfo(
+                protection_name=desc,
+                insurance_amount=amount,
+                annual_premium=annual,
+                monthly_premium=monthly,
+            )
+            protections.append(current_protection)
+
+        elif current_protection and desc and not desc.startswith("("):
+            # This might be a continuation of the previous protection name
+            # (multi-line protection names like "Avenant Assurance dette...")
+            if not amount_raw and not annual_raw:
+                current_protection.protection_name += " " + desc
+
+    if not insured_info:
+        print(f"Warning: Could not parse insured info from {pdf_name}")
+        return None
+
+    return SummaryExtraction(
+        document_date=document_date,
+        advisor_name=advisor_name,
+        insured=insured_info,
+        protections=protections,
+        total_annual_premium=total_annual_premium,
+        total_monthly_premium=total_monthly_premium,
+    )
+
+
+def extract_summary_with_pdfplumber(pdf_path: Path) -> SummaryExtraction | None:
+    """
+    Open a PDF file and extract its summary (see extract_summary_from_pdf).
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        SummaryExtraction object or None if extraction fails
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return extract_summary_from_pdf(pdf, Path(pdf_path).name)
 
 
 # =============================================================================
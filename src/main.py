@@ -505,7 +505,11 @@ class IllustrationPipeline:
         # Metadata columns to skip
         metadata_columns = ["pdf_filename"]
 
-        for _, row in df.iterrows():
+        # itertuples avoids building a Series per row
+        columns = list(df.columns)
+        for values in df.itertuples(index=False, name=None):
+            row = dict(zip(columns, values))
+
             # Create item name from insured_name and product_name
             insured_name = str(row.get("insured_name", "Unknown"))
             product_name = str(row.get("product_name", "Unknown"))
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 """UI package."""
 
-from .styles import apply_global_styles, apply_login_styles
+from .styles import (
+    apply_all_styles,
+    apply_global_styles,
+    apply_deferred_styles,
+    apply_login_styles,
+    apply_deferred_login_styles
+)
 from .components import (
     render_stat_card,
     render_board_card,
@@ -14,8 +20,11 @@ from .components import (
 )
 
 __all__ = [
+    'apply_all_styles',
     'apply_global_styles',
+    'apply_deferred_styles',
     'apply_login_styles',
+    'apply_deferred_login_styles',
     'render_stat_card',
     'render_board_card',
     'render_badge',
@@ -4,15 +4,20 @@ Employee illustrations upload page.
 Handles PDF extraction and upload to Monday.com.
 """
 
+import io
 import os
+import shutil
+import sys
 import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
+from string import Template
 from typing import Optional
 
-import pandas as pd
 import streamlit as st
 
-from services.monday_integration import MondayIntegration
 from ui.components import (
     render_gradient_header,
     render_info_box,
@@ -22,6 +27,83 @@ from ui.components import (
 from config import ROLE_ADMIN
 
 
+# Number of items sent per create_items_batch call during upload
+_UPLOAD_CHUNK_SIZE = 50
+
+# Unified columns uploaded to Monday.com, and those created as number columns
+_COLUMN_NAMES: tuple[str, ...] = (
+    "insurer_name", "report_date", "advisor_name", "insured_number",
+    "last_name", "first_name", "insured_name", "sex", "birth_date",
+    "age", "smoker", "product_name", "coverage_amount", "policy_premium",
+    "monthly_premium", "payment_duration", "details",
+)
+
+_NUMERIC_COLS: frozenset[str] = frozenset({"age", "coverage_amount", "policy_premium", "monthly_premium"})
+
+# Rows shown in the preview table before the "show all" toggle
+_PREVIEW_MAX_ROWS = 200
+
+# String forms of empty cells that must not be sent to Monday.com
+_EMPTY_VALUE_STRINGS = ["None", "nan", "NaN", "NaT", "<NA>", ""]
+
+# Initial session state values for the illustrations workflow
+_ILLUSTRATION_DEFAULTS = {
+    'illustration_stage': 1,
+    'illustration_pdf_path': None,
+    'illustration_pdf_file': None,
+    'illustration_source': None,
+    'illustration_data': None,
+    'illustration_board_id': None,
+    'illustration_board_name': None,
+    'illustration_group_name': None,
+    'illustration_upload_results': None,
+    'illustration_create_new_board': False,
+    'illustration_new_board_name': None,
+}
+
+# Stepper stages: (number, name, icon)
+_STEPPER_STAGES = [
+    ("1", "Upload PDF", "📤"),
+    ("2", "Previsualisation", "🔍"),
+    ("3", "Resultat", "✅"),
+]
+
+# Stepper cell templates: current, completed and upcoming stage
+_STEPPER_ACTIVE_TPL = Template("""
+<div style="text-align: center; padding: 10px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+border-radius: 10px; color: white;">
+    <div style="font-size: 1.5rem;">$icon</div>
+    <div style="font-weight: 600;">$name</div>
+</div>
+""")
+
+_STEPPER_DONE_TPL = Template("""
+<div style="text-align: center; padding: 10px; background: #d4edda;
+border-radius: 10px; color: #155724;">
+    <div style="font-size: 1.5rem;">✅</div>
+    <div style="font-weight: 500;">$name</div>
+</div>
+""")
+
+_STEPPER_PENDING_TPL = Template("""
+<div style="text-align: center; padding: 10px; background: #f8f9fa;
+border-radius: 10px; color: #6c757d;">
+    <div style="font-size: 1.5rem;">$icon</div>
+    <div>$name</div>
+</div>
+""")
+
+# Precomputed (active, completed, pending) HTML for each stage
+_STEPPER_CELLS: list[tuple[str, str, str]] = [
+    (
+        _STEPPER_ACTIVE_TPL.substitute(icon=icon, name=name),
+        _STEPPER_DONE_TPL.substitute(name=name),
+        _STEPPER_PENDING_TPL.substitute(icon=icon, name=name),
+    )
+    for _num, name, icon in _STEPPER_STAGES
+]
+
+
 def render_illustrations_page(user, user_boards: list) -> None:
     """Render the illustrations upload page."""
     render_gradient_header(
@@ -49,81 +131,87 @@ def render_illustrations_page(user, user_boards: list) -> None:
 
 def _init_illustrations_state() -> None:
     """Initialize session state for illustrations."""
-    defaults = {
-        'illustration_stage': 1,
-        'illustration_pdf_path': None,
-        'illustration_source': None,
-        'illustration_data': None,
-        'illustration_board_id': None,
-        'illustration_board_name': None,
-        'illustration_group_name': None,
-        'illustration_upload_results': None,
-        'illustration_create_new_board': False,
-        'illustration_new_board_name': None,
-    }
-
-    for key, default in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = default
+    # All keys are set together, so one present key means the state is ready
+    if 'illustration_stage' in st.session_state:
+        return
+
+    st.session_state.update(_ILLUSTRATION_DEFAULTS)
+
+
+def _safe_unlink(path: str) -> None:
+    """Remove a temp file, ignoring errors if it is already gone."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _SessionTempFile:
+    """
+    Temp file owned by one session.
+
+    The file is removed by cleanup(), or by the finalizer when the object is
+    garbage-collected (session dropped from st.session_state) or at exit.
+    """
+
+    __slots__ = ("path", "_finalizer", "__weakref__")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._finalizer = weakref.finalize(self, _safe_unlink, path)
+
+    def cleanup(self) -> None:
+        """Remove the file now and release the finalizer (idempotent)."""
+        self._finalizer()
+
+
+def _copy_upload(uploaded_file, dst) -> None:
+    """Copy an uploaded file into dst, using sendfile when the upload is disk-backed."""
+    src = getattr(uploaded_file, "_file", uploaded_file)
+
+    if sys.platform.startswith("linux"):
+        try:
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            offset = 0
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+            return
+        except (AttributeError, OSError, ValueError):
+            # In-memory upload (no fd) or sendfile unsupported: start over
+            dst.seek(0)
+            dst.truncate()
+
+    uploaded_file.seek(0)
+    shutil.copyfileobj(uploaded_file, dst, 1 << 20)
 
 
 def _reset_illustrations_state() -> None:
     """Reset illustrations state to start over."""
     # Clean up temp file
-    if st.session_state.illustration_pdf_path:
-        try:
-            os.remove(st.session_state.illustration_pdf_path)
-        except Exception:
-            pass
-
-    st.session_state.illustration_stage = 1
-    st.session_state.illustration_pdf_path = None
-    st.session_state.illustration_source = None
-    st.session_state.illustration_data = None
-    st.session_state.illustration_board_id = None
-    st.session_state.illustration_board_name = None
-    st.session_state.illustration_group_name = None
-    st.session_state.illustration_upload_results = None
-    st.session_state.illustration_create_new_board = False
-    st.session_state.illustration_new_board_name = None
+    if st.session_state.illustration_pdf_file is not None:
+        st.session_state.illustration_pdf_file.cleanup()
+
+    st.session_state.update(_ILLUSTRATION_DEFAULTS)
 
 
 def _render_stepper() -> None:
     """Render progress stepper."""
-    stages = [
-        ("1", "Upload PDF", "📤"),
-        ("2", "Previsualisation", "🔍"),
-        ("3", "Resultat", "✅"),
-    ]
-
-    cols = st.columns(3)
-    for i, (num, name, icon) in enumerate(stages):
+    current = st.session_state.illustration_stage
+
+    cols = st.columns(len(_STEPPER_CELLS))
+    for i, cell in enumerate(_STEPPER_CELLS):
         stage_num = i + 1
+        variant = 0 if stage_num == current else 1 if stage_num < current else 2
         with cols[i]:
-            if stage_num == st.session_state.illustration_stage:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 10px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                border-radius: 10px; color: white;">
-                    <div style="font-size: 1.5rem;">{icon}</div>
-                    <div style="font-weight: 600;">{name}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            elif stage_num < st.session_state.illustration_stage:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 10px; background: #d4edda;
-                border-radius: 10px; color: #155724;">
-                    <div style="font-size: 1.5rem;">✅</div>
-                    <div style="font-weight: 500;">{name}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 10px; background: #f8f9fa;
-                border-radius: 10px; color: #6c757d;">
-                    <div style="font-size: 1.5rem;">{icon}</div>
-                    <div>{name}</div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(cell[variant], unsafe_allow_html=True)
 
     st.write("")
 
@@ -238,11 +326,17 @@ def _render_stage_upload(user, user_boards: list) -> None:
                     st.error("Veuillez selectionner un board")
                 return
 
-            # Save file to temp
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(uploaded_file.getbuffer())
-                pdf_path = tmp.name
-
+            # Save file to temp (removed on reset, or when the session is dropped)
+            fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as tmp:
+                _copy_upload(uploaded_file, tmp)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            # A new extraction replaces the previous temp file of this session
+            if st.session_state.illustration_pdf_file is not None:
+                st.session_state.illustration_pdf_file.cleanup()
+            st.session_state.illustration_pdf_file = _SessionTempFile(pdf_path)
             st.session_state.illustration_pdf_path = pdf_path
             st.session_state.illustration_source = source
             st.session_state.illustration_board_id = selected_board_id
@@ -303,14 +397,24 @@ def _render_stage_preview() -> None:
     # Data preview
     st.markdown("### Donnees extraites")
 
-    # Show all columns
-    st.dataframe(df, width="stretch", height=400)
+    # Show all columns, but only the first rows unless asked otherwise
+    if len(df) > _PREVIEW_MAX_ROWS:
+        show_full = st.checkbox(
+            f"Afficher toutes les lignes ({len(df)})",
+            value=False,
+            key="illustration_preview_show_full"
+        )
+    else:
+        show_full = True
+    st.dataframe(df if show_full else df.head(_PREVIEW_MAX_ROWS), width="stretch", height=400)
 
-    # Download CSV
-    csv = df.to_csv(index=False).encode('utf-8')
+    # Download CSV (pandas writes UTF-8 bytes directly into the buffer)
+    csv_buffer = io.BytesIO()
+    df.to_csv(csv_buffer, index=False, encoding='utf-8')
+    csv_buffer.seek(0)
     st.download_button(
         "Telecharger CSV",
-        data=csv,
+        data=csv_buffer,
         file_name=f"extraction_{st.session_state.illustration_source}.csv",
         mime="text/csv"
     )
@@ -332,6 +436,8 @@ def _render_stage_preview() -> None:
 
 def _execute_upload() -> None:
     """Execute upload to Monday.com."""
+    import pandas as pd
+
     df = st.session_state.illustration_data
     api_key = st.session_state.monday_api_key
     board_id = st.session_state.illustration_board_id
@@ -365,74 +471,82 @@ def _execute_upload() -> None:
                 st.error(f"Erreur lors de la creation du board: {board_result.error}")
                 return
 
-        # Create group if specified
-        status.text("Configuration du groupe...")
+        # Create group and setup columns concurrently (independent API calls)
+        status.text("Configuration du groupe et des colonnes...")
         progress.progress(20)
 
-        group_id = None
-        if group_name:
-            group_result = client.create_group(
-                board_id=int(board_id),
-                group_name=group_name,
-                group_color="#0086c0",
-                reuse_existing=True
-            )
-            if group_result.success:
-                group_id = group_result.group_id
-
-        progress.progress(40)
-
-        # Setup columns
-        status.text("Configuration des colonnes...")
+        present_cols = [col for col in _COLUMN_NAMES if col in df.columns]
 
-        column_names = [
-            "insurer_name", "report_date", "advisor_name", "insured_number",
-            "last_name", "first_name", "insured_name", "sex", "birth_date",
-            "age", "smoker", "product_name", "coverage_amount", "policy_premium",
-            "monthly_premium", "payment_duration", "details"
-        ]
-
-        numeric_cols = {"age", "coverage_amount", "policy_premium", "monthly_premium"}
-
-        column_mapping = {}
-        for col in column_names:
-            if col in df.columns:
-                col_type = "numbers" if col in numeric_cols else "text"
-                mapping = client.get_or_create_columns(
+        def _setup_columns() -> dict:
+            """Get or create columns in schema order, one call per run of same-typed columns."""
+            mapping = {}
+            for col_type, run in groupby(
+                present_cols, key=lambda col: "numbers" if col in _NUMERIC_COLS else "text"
+            ):
+                mapping.update(client.get_or_create_columns(
                     board_id=int(board_id),
-                    column_names=[col],
+                    column_names=list(run),
                     column_type=col_type
+                ))
+            return mapping
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fut_group = None
+            if group_name:
+                fut_group = executor.submit(
+                    client.create_group,
+                    board_id=int(board_id),
+                    group_name=group_name,
+                    group_color="#0086c0",
+                    reuse_existing=True
                 )
-                column_mapping.update(mapping)
+            fut_columns = executor.submit(_setup_columns)
+
+            group_id = None
+            if fut_group is not None:
+                group_result = fut_group.result()
+                if group_result.success:
+                    group_id = group_result.group_id
+
+            column_mapping = fut_columns.result()
 
         progress.progress(60)
 
         # Prepare items
         status.text("Preparation des items...")
 
-        items = []
-        for _, row in df.iterrows():
-            insured_name = str(row.get("insured_name", "Unknown"))
-            product_name = str(row.get("product_name", "Unknown"))
-            item_name = f"{insured_name} - {product_name}"
+        # Blank out missing/sentinel values in one vectorized pass
+        str_df = df.astype(str)
+        bad_mask = df.isna() | str_df.isin(_EMPTY_VALUE_STRINGS)
+        clean_df = str_df.where(~bad_mask, "")
 
-            column_values = {}
-            for col_name, col_value in row.items():
-                if col_name == "pdf_filename":
-                    continue
-                if col_name not in column_mapping:
-                    continue
-
-                column_id = column_mapping[col_name]
-
-                if pd.isna(col_value) or col_value is None or col_value == "":
-                    continue
+        # Only columns that exist on the board are sent (pdf_filename is metadata)
+        keep_cols = [
+            col for col in clean_df.columns
+            if col in column_mapping and col != "pdf_filename"
+        ]
+        column_ids = [column_mapping[col] for col in keep_cols]
 
-                value_str = str(col_value)
-                if value_str in ["None", "nan", "NaN", "NaT"]:
-                    continue
+        # Item names "insured_name - product_name", built column-wise
+        unknown = pd.Series("Unknown", index=clean_df.index)
+        insured_names = (
+            clean_df["insured_name"].replace("", "Unknown")
+            if "insured_name" in clean_df.columns else unknown
+        )
+        product_names = (
+            clean_df["product_name"].replace("", "Unknown")
+            if "product_name" in clean_df.columns else unknown
+        )
+        item_names = (insured_names + " - " + product_names).tolist()
 
-                column_values[column_id] = value_str
+        items = []
+        rows = clean_df[keep_cols].itertuples(index=False, name=None)
+        for item_name, values in zip(item_names, rows):
+            column_values = {
+                column_id: value_str
+                for column_id, value_str in zip(column_ids, values)
+                if value_str
+            }
 
             item = {"name": item_name}
             if column_values:
@@ -444,25 +558,39 @@ def _execute_upload() -> None:
         # Upload items
         status.text(f"Upload des {len(items)} items...")
 
-        results = client.create_items_batch(
-            board_id=int(board_id),
-            items=items,
-            group_id=group_id
-        )
+        results = []
+        total_items = len(items)
+        for start in range(0, total_items, _UPLOAD_CHUNK_SIZE):
+            chunk_results = client.create_items_batch(
+                board_id=int(board_id),
+                items=items[start:start + _UPLOAD_CHUNK_SIZE],
+                group_id=group_id
+            )
+            results.extend(chunk_results)
+
+            done = min(start + _UPLOAD_CHUNK_SIZE, total_items)
+            status.text(f"Upload des items... ({done}/{total_items})")
+            progress.progress(70 + int(30 * done / total_items))
+
+            # Abort early if a whole chunk failed (network or API issue)
+            if chunk_results and not any(r.success for r in chunk_results):
+                break
 
         progress.progress(100)
         status.empty()
 
-        # Analyze results
+        # Analyze results (items left unsent after an abort count as failed)
         successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        skipped = total_items - len(results)
+        failed = total_items - successful
 
         st.session_state.illustration_upload_results = {
             'success': successful > 0,
             'board_id': board_id,
             'group_id': group_id,
             'items_uploaded': successful,
-            'items_failed': failed
+            'items_failed': failed,
+            'items_skipped': skipped,
         }
 
         st.session_state.illustration_stage = 3
@@ -486,8 +614,14 @@ def _render_stage_upload_results() -> None:
         return
 
     if results['success']:
-        st.balloons()
-        st.success("Upload termine avec succes!")
+        if results.get('items_skipped'):
+            st.warning(
+                f"Upload interrompu: un lot complet a echoue, "
+                f"{results['items_skipped']} items n'ont pas ete envoyes"
+            )
+        else:
+            st.balloons()
+            st.success("Upload termine avec succes!")
 
         cols = st.columns(3)
         cols[0].metric("Items crees", results['items_uploaded'])
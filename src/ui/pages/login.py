@@ -6,15 +6,65 @@ Login page rendering.
 import streamlit as st
 
 from config import APP_NAME
-from ui.styles import apply_login_styles
+from ui.styles import apply_deferred_login_styles
+
+
+# =============================================================================
+# STATIC MARKUP (built once at import, reused on every rerun)
+# =============================================================================
+
+_BG_HTML = '<div class="login-bg"></div>'
+
+_GLASS_CARD_HTML = f"""
+<div class="glass-card">
+    <div class="logo-container">
+        <span class="logo-icon">📊</span>
+    </div>
+    <h1 class="login-title">{APP_NAME}</h1>
+    <p class="login-subtitle">Plateforme de gestion des commissions d'assurance</p>
+</div>
+"""
+
+_FORM_CONTAINER_OPEN_HTML = """
+<div style="background: white; border-radius: 20px; padding: 0.5rem;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.1); border: 1px solid #e8e8e8;">
+"""
+
+_FEATURE_ITEM_TEMPLATE = """
+<div class="feature-item">
+    <div class="feature-icon">{icon}</div>
+    <span class="feature-text">{text}</span>
+</div>
+"""
+
+_FEATURES_HTML_LEFT = (
+    _FEATURE_ITEM_TEMPLATE.format(icon="📋", text="Gestion des boards"),
+    _FEATURE_ITEM_TEMPLATE.format(icon="🔐", text="Acces securise"),
+)
+
+_FEATURES_HTML_RIGHT = (
+    _FEATURE_ITEM_TEMPLATE.format(icon="👥", text="Multi-utilisateurs"),
+    _FEATURE_ITEM_TEMPLATE.format(icon="📈", text="Statistiques"),
+)
+
+_HINT_HTML = """
+<div class="login-hint">
+    <div class="login-hint-title">Premiere connexion</div>
+    <div class="login-hint-content">
+        Identifiant: <code>admin</code> &nbsp;|&nbsp; Mot de passe: <code>admin123</code>
+    </div>
+</div>
+"""
 
 
 def render_login_page() -> None:
-    """Render modern login page with enhanced design."""
-    apply_login_styles()
+    """Render modern login page with enhanced design.
 
+    Critical login styles are emitted by the app together with the global
+    styles (apply_all_styles("login")); only deferred ones are added here.
+    """
     # Background gradient
-    st.markdown('<div class="login-bg"></div>', unsafe_allow_html=True)
+    st.markdown(_BG_HTML, unsafe_allow_html=True)
 
     # Center the login form
     col1, col2, col3 = st.columns([1, 1.8, 1])
@@ -23,24 +73,13 @@ def render_login_page() -> None:
         st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
 
         # Glass card container
-        st.markdown(f"""
-        <div class="glass-card">
-            <div class="logo-container">
-                <span class="logo-icon">📊</span>
-            </div>
-            <h1 class="login-title">{APP_NAME}</h1>
-            <p class="login-subtitle">Plateforme de gestion des commissions d'assurance</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_GLASS_CARD_HTML, unsafe_allow_html=True)
 
         st.markdown('<div style="height: 1rem;"></div>', unsafe_allow_html=True)
 
         # Login form in a styled container
         with st.container():
-            st.markdown("""
-            <div style="background: white; border-radius: 20px; padding: 0.5rem;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.1); border: 1px solid #e8e8e8;">
-            """, unsafe_allow_html=True)
+            st.markdown(_FORM_CONTAINER_OPEN_HTML, unsafe_allow_html=True)
 
             with st.form("login_form", clear_on_submit=False):
                 st.markdown('<p class="input-label">👤 Identifiant</p>', unsafe_allow_html=True)
@@ -76,6 +115,8 @@ def render_login_page() -> None:
         _render_features()
         _render_hint()
 
+    apply_deferred_login_styles()
+
 
 def _handle_login() -> None:
     """Handle login form submission."""
@@ -99,46 +140,14 @@ def _render_features() -> None:
     """Render feature cards."""
     st.markdown('<div style="height: 1.5rem;"></div>', unsafe_allow_html=True)
 
-    col_f1, col_f2 = st.columns(2)
-    with col_f1:
-        st.markdown("""
-        <div class="feature-item">
-            <div class="feature-icon">📋</div>
-            <span class="feature-text">Gestion des boards</span>
-        </div>
-        """, unsafe_allow_html=True)
-    with col_f2:
-        st.markdown("""
-        <div class="feature-item">
-            <div class="feature-icon">👥</div>
-            <span class="feature-text">Multi-utilisateurs</span>
-        </div>
-        """, unsafe_allow_html=True)
-
-    col_f3, col_f4 = st.columns(2)
-    with col_f3:
-        st.markdown("""
-        <div class="feature-item">
-            <div class="feature-icon">🔐</div>
-            <span class="feature-text">Acces securise</span>
-        </div>
-        """, unsafe_allow_html=True)
-    with col_f4:
-        st.markdown("""
-        <div class="feature-item">
-            <div class="feature-icon">📈</div>
-            <span class="feature-text">Statistiques</span>
-        </div>
-        """, unsafe_allow_html=True)
+    for left_html, right_html in zip(_FEATURES_HTML_LEFT, _FEATURES_HTML_RIGHT):
+        col_left, col_right = st.columns(2)
+        with col_left:
+            st.markdown(left_html, unsafe_allow_html=True)
+        with col_right:
+            st.markdown(right_html, unsafe_allow_html=True)
 
 
 def _render_hint() -> None:
     """Render login hint box."""
-    st.markdown("""
-    <div class="login-hint">
-        <div class="login-hint-title">Premiere connexion</div>
-        <div class="login-hint-content">
-            Identifiant: <code>admin</code> &nbsp;|&nbsp; Mot de passe: <code>admin123</code>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HINT_HTML, unsafe_allow_html=True)
@@ -65,19 +65,25 @@ Date: 2025-12-11
 Version: 1.0.0
 """
 
+from __future__ import annotations
+
+import os
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, Optional
 
-# Import source extractors
-from extract_uv_pdf import extract_summary_with_pdfplumber as extract_uv
-from extract_assomption_pdf import extract_summary_with_pdfplumber as extract_assomption
+# pandas and the source extractors (pdfplumber) are imported inside the
+# functions that need them, so the parsing helpers stay cheap to import
+if TYPE_CHECKING:
+    import pandas as pd
+    import pdfplumber
 
 warnings.filterwarnings("ignore")
 
@@ -119,13 +125,26 @@ UNIFIED_COLUMNS = [
     "details",
 ]
 
+# Explicit nullable dtypes for typed columns (others stay object)
+UNIFIED_DTYPES = {
+    "age": "Int64",
+    "smoker": "boolean",
+    "coverage_amount": "Float64",
+    "policy_premium": "Float64",
+    "monthly_premium": "Float64",
+}
+
+# Fixed category sets for the categorical columns
+INSURER_CATEGORIES = [source.value for source in InsuranceSource]
+SEX_CATEGORIES = ["Homme", "Femme"]
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnifiedInsured:
     """Unified insured person information."""
 
@@ -143,7 +162,7 @@ class UnifiedInsured:
         return f"{self.first_name} {self.last_name}".strip()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnifiedProtection:
     """Unified protection/guarantee information."""
 
@@ -155,7 +174,7 @@ class UnifiedProtection:
     details: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnifiedExtraction:
     """Unified extraction result from any source."""
 
@@ -163,8 +182,8 @@ class UnifiedExtraction:
     document_date: str
     advisor_name: str
     pdf_filename: str
-    insured_persons: list[UnifiedInsured]
-    protections: list[UnifiedProtection]
+    insured_persons: list[UnifiedInsured] = field(default_factory=list)
+    protections: list[UnifiedProtection] = field(default_factory=list)
     total_annual_premium: Optional[float] = None
     total_monthly_premium: Optional[float] = None
     payment_interval: Optional[str] = None
@@ -182,9 +201,17 @@ FRENCH_MONTHS = {
 }
 
 # French day names to strip
-FRENCH_DAYS = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"]
+FRENCH_DAYS = ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche")
 
+# "[day name] 17 novembre[,] 2025" -> (day, month name, year)
+_FRENCH_DATE_RE = re.compile(
+    rf"(?:(?:{'|'.join(FRENCH_DAYS)})\s*,?\s*)?"
+    r"(\d{1,2})\s+([^\W\d_]+)\s*,?\s+(\d{4})",
+    re.IGNORECASE,
+)
 
+
+@lru_cache(maxsize=4096)
 def parse_french_date(date_str: str | None) -> Optional[str]:
     """
     Parse a French date string and return YYYY-MM-DD format.
@@ -203,41 +230,29 @@ def parse_french_date(date_str: str | None) -> Optional[str]:
     if not date_str or not isinstance(date_str, str):
         return None
 
-    # Clean the string
-    cleaned = date_str.lower().strip()
-
-    # Remove day name if present
-    for day in FRENCH_DAYS:
-        if cleaned.startswith(day):
-            cleaned = cleaned[len(day):].strip()
-            break
-
-    # Remove commas and extra spaces
-    cleaned = cleaned.replace(",", "").strip()
-    cleaned = " ".join(cleaned.split())  # Normalize spaces
-
-    # Try to parse: "17 novembre 2025"
-    parts = cleaned.split()
-    if len(parts) >= 3:
-        try:
-            day = int(parts[0])
-            month_name = parts[1].lower()
-            year = int(parts[2])
+    match = _FRENCH_DATE_RE.match(date_str.strip())
+    if not match:
+        return None
 
-            month = FRENCH_MONTHS.get(month_name)
-            if month:
-                return f"{year:04d}-{month:02d}-{day:02d}"
-        except (ValueError, IndexError):
-            pass
+    day, month_name, year = match.groups()
+    month = FRENCH_MONTHS.get(month_name.lower())
+    if not month:
+        return None
 
-    return None
+    return f"{int(year):04d}-{month:02d}-{int(day):02d}"
 
 
 # =============================================================================
 # CURRENCY PARSING UTILITIES
 # =============================================================================
 
+# "$" and spaces (incl. non-breaking) removed, "," -> "." (French decimal separator)
+_CURRENCY_TRANS = str.maketrans({"$": None, " ": None, "\xa0": None, "\u202f": None, ",": "."})
+_CURRENCY_BYTES_TRANS = bytes.maketrans(b",", b".")
+_CURRENCY_BYTES_DELETE = b"$ \xa0"
+
 
+@lru_cache(maxsize=4096)
 def parse_currency(value: str | None) -> Optional[float]:
     """
     Parse a currency string to float.
@@ -247,6 +262,7 @@ def parse_currency(value: str | None) -> Optional[float]:
         - "556,50 $" -> 556.50
         - "25 000,00 $" -> 25000.00
         - "1000$" -> 1000.0
+        - "1 250,00 $" with a non-breaking space -> 1250.00
 
     Args:
         value: Currency string to parse
@@ -257,18 +273,18 @@ def parse_currency(value: str | None) -> Optional[float]:
     if not value or not isinstance(value, str):
         return None
 
-    # Remove currency symbol and whitespace
-    cleaned = value.replace("$", "").replace(" ", "").strip()
+    # Single pass: drop currency symbol and (non-breaking) spaces used as
+    # thousand separators, and turn the French decimal comma into a dot.
+    # The bytes path is ~2x faster; text outside Latin-1 (e.g. narrow
+    # no-break space) goes through the str table instead.
+    try:
+        cleaned = value.encode("latin-1").translate(_CURRENCY_BYTES_TRANS, _CURRENCY_BYTES_DELETE).strip()
+    except UnicodeEncodeError:
+        cleaned = value.translate(_CURRENCY_TRANS).strip()
 
     if not cleaned:
         return None
 
-    # Handle French decimal separator (comma -> dot)
-    # But be careful: "25000,00" has comma as decimal, "25 000" has space as thousand sep
-    if "," in cleaned:
-        # If there's a comma, it's likely a decimal separator
-        cleaned = cleaned.replace(",", ".")
-
     try:
         return float(cleaned)
     except ValueError:
@@ -391,6 +407,80 @@ def convert_assomption_extraction(extraction, pdf_path: Path) -> UnifiedExtracti
 # =============================================================================
 
 
+def _extend_unified_columns(columns: dict[str, list], extraction: UnifiedExtraction) -> None:
+    """
+    Append the rows of one extraction to per-column lists.
+
+    Creates one row per protection per insured person.
+
+    Args:
+        columns: Mapping of unified column name -> list of values (extended in place)
+        extraction: UnifiedExtraction object
+    """
+    # One (insured, protection) pair per row, built column by column
+    pairs = list(product(extraction.insured_persons, extraction.protections))
+    insured_rows = [insured for insured, _ in pairs]
+    prot_rows = [prot for _, prot in pairs]
+    n_rows = len(pairs)
+
+    # Document info
+    columns["insurer_name"].extend([extraction.source.value] * n_rows)
+    columns["report_date"].extend([extraction.document_date] * n_rows)
+    columns["advisor_name"].extend([extraction.advisor_name] * n_rows)
+    columns["pdf_filename"].extend([extraction.pdf_filename] * n_rows)
+    # Insured info
+    columns["insured_number"].extend(i.insured_number for i in insured_rows)
+    columns["last_name"].extend(i.last_name for i in insured_rows)
+    columns["first_name"].extend(i.first_name for i in insured_rows)
+    columns["insured_name"].extend(i.insured_name for i in insured_rows)
+    columns["sex"].extend(i.sex for i in insured_rows)
+    columns["birth_date"].extend(i.birth_date for i in insured_rows)
+    columns["age"].extend(i.age for i in insured_rows)
+    columns["smoker"].extend(i.smoker for i in insured_rows)
+    # Protection info
+    columns["product_name"].extend(p.product_name for p in prot_rows)
+    columns["coverage_amount"].extend(p.coverage_amount for p in prot_rows)
+    columns["policy_premium"].extend(p.policy_premium for p in prot_rows)
+    columns["monthly_premium"].extend(p.monthly_premium for p in prot_rows)
+    columns["payment_duration"].extend(p.payment_duration for p in prot_rows)
+    columns["details"].extend(p.details for p in prot_rows)
+
+
+def _columns_to_dataframe(columns: dict[str, list]) -> pd.DataFrame:
+    """Build a typed unified DataFrame from per-column lists."""
+    import pandas as pd
+
+    # Nullable dtypes keep numeric columns numeric even when values are missing
+    df = pd.DataFrame(columns, columns=UNIFIED_COLUMNS).astype(UNIFIED_DTYPES)
+
+    # Low-cardinality text columns stored as categoricals
+    df["insurer_name"] = pd.Categorical(df["insurer_name"], categories=INSURER_CATEGORIES)
+    df["sex"] = pd.Categorical(df["sex"], categories=SEX_CATEGORIES)
+
+    return df
+
+
+def _empty_unified_dataframe() -> pd.DataFrame:
+    """
+    Build an empty unified DataFrame with the final column dtypes.
+
+    Text columns get the dtype pandas infers for strings in real frames
+    (object, or str with pandas 3), so concatenating the empty frame with
+    real results keeps every column's dtype.
+    """
+    import pandas as pd
+
+    df = _columns_to_dataframe({col: [] for col in UNIFIED_COLUMNS})
+
+    # Empty lists come out as float64; retype the plain text columns
+    text_dtype = pd.Series([""]).dtype
+    text_columns = [
+        col for col in UNIFIED_COLUMNS
+        if col not in UNIFIED_DTYPES and col not in ("insurer_name", "sex")
+    ]
+    return df.astype(dict.fromkeys(text_columns, text_dtype))
+
+
 def unified_to_dataframe(extraction: UnifiedExtraction) -> pd.DataFrame:
     """
     Convert a UnifiedExtraction to a pandas DataFrame.
@@ -404,37 +494,9 @@ def unified_to_dataframe(extraction: UnifiedExtraction) -> pd.DataFrame:
     Returns:
         DataFrame with unified columns
     """
-    rows = []
-
-    # Create rows for each insured person with all protections
-    for insured in extraction.insured_persons:
-        for prot in extraction.protections:
-            row = {
-                # Document info
-                "insurer_name": extraction.source.value,
-                "report_date": extraction.document_date,
-                "advisor_name": extraction.advisor_name,
-                "pdf_filename": extraction.pdf_filename,
-                # Insured info
-                "insured_number": insured.insured_number,
-                "last_name": insured.last_name,
-                "first_name": insured.first_name,
-                "insured_name": insured.insured_name,
-                "sex": insured.sex,
-                "birth_date": insured.birth_date,
-                "age": insured.age,
-                "smoker": insured.smoker,
-                # Protection info
-                "product_name": prot.product_name,
-                "coverage_amount": prot.coverage_amount,
-                "policy_premium": prot.policy_premium,
-                "monthly_premium": prot.monthly_premium,
-                "payment_duration": prot.payment_duration,
-                "details": prot.details,
-            }
-            rows.append(row)
-
-    df = pd.DataFrame(rows, columns=UNIFIED_COLUMNS)
+    columns = {col: [] for col in UNIFIED_COLUMNS}
+    _extend_unified_columns(columns, extraction)
+    df = _columns_to_dataframe(columns)
 
     # Store totals and metadata as DataFrame attributes
     df.attrs["total_annual_premium"] = extraction.total_annual_premium
@@ -443,20 +505,34 @@ def unified_to_dataframe(extraction: UnifiedExtraction) -> pd.DataFrame:
     df.attrs["source"] = extraction.source.value
     df.attrs["pdf_filename"] = extraction.pdf_filename
 
-    # Store all insured persons for reference
-    df.attrs["insured_persons"] = [
-        {
-            "insured_number": p.insured_number,
-            "last_name": p.last_name,
-            "first_name": p.first_name,
-            "insured_name": p.insured_name,
-            "sex": p.sex,
-            "birth_date": p.birth_date,
-            "age": p.age,
-            "smoker": p.smoker,
-        }
-        for p in extraction.insured_persons
-    ]
+    # Store all insured persons for reference (use dataclasses.asdict for dicts)
+    df.attrs["insured_persons"] = tuple(extraction.insured_persons)
+
+    return df
+
+
+def unified_list_to_dataframe(extractions: list[UnifiedExtraction]) -> pd.DataFrame:
+    """
+    Convert many UnifiedExtraction objects to a single pandas DataFrame.
+
+    Equivalent to concatenating unified_to_dataframe() of each extraction,
+    but fills one set of column lists and builds the frame once, without
+    intermediate per-file DataFrames. Per-file attrs are not kept.
+
+    Args:
+        extractions: UnifiedExtraction objects (e.g. one per PDF)
+
+    Returns:
+        DataFrame with unified columns
+    """
+    columns = {col: [] for col in UNIFIED_COLUMNS}
+    for extraction in extractions:
+        _extend_unified_columns(columns, extraction)
+
+    df = _columns_to_dataframe(columns)
+
+    df.attrs["files_processed"] = len(extractions)
+    df.attrs["total_protections"] = len(df)
 
     return df
 
@@ -466,19 +542,29 @@ def unified_to_dataframe(extraction: UnifiedExtraction) -> pd.DataFrame:
 # =============================================================================
 
 
-def extract_and_unify_uv(pdf_path: str | Path) -> pd.DataFrame | None:
+def extract_and_unify_uv(
+    pdf_path: str | Path,
+    pdf: pdfplumber.PDF | None = None,
+) -> pd.DataFrame | None:
     """
     Extract and unify data from a UV insurance PDF.
 
     Args:
         pdf_path: Path to the UV PDF file
+        pdf: Already opened pdfplumber PDF for pdf_path (opened here if None)
 
     Returns:
         Unified DataFrame or None if extraction fails
     """
-    pdf_path = Path(pdf_path)
+    from extract_uv_pdf import extract_summary_from_pdf, extract_summary_with_pdfplumber
+
+    if not isinstance(pdf_path, Path):
+        pdf_path = Path(pdf_path)
 
-    extraction = extract_uv(pdf_path)
+    if pdf is not None:
+        extraction = extract_summary_from_pdf(pdf, pdf_path.name)
+    else:
+        extraction = extract_summary_with_pdfplumber(pdf_path)
     if not extraction:
         return None
 
@@ -486,19 +572,29 @@ def extract_and_unify_uv(pdf_path: str | Path) -> pd.DataFrame | None:
     return unified_to_dataframe(unified)
 
 
-def extract_and_unify_assomption(pdf_path: str | Path) -> pd.DataFrame | None:
+def extract_and_unify_assomption(
+    pdf_path: str | Path,
+    pdf: pdfplumber.PDF | None = None,
+) -> pd.DataFrame | None:
     """
     Extract and unify data from an Assomption insurance PDF.
 
     Args:
         pdf_path: Path to the Assomption PDF file
+        pdf: Already opened pdfplumber PDF for pdf_path (opened here if None)
 
     Returns:
         Unified DataFrame or None if extraction fails
     """
-    pdf_path = Path(pdf_path)
+    from extract_assomption_pdf import extract_summary_from_pdf, extract_summary_with_pdfplumber
+
+    if not isinstance(pdf_path, Path):
+        pdf_path = Path(pdf_path)
 
-    extraction = extract_assomption(pdf_path)
+    if pdf is not None:
+        extraction = extract_summary_from_pdf(pdf, pdf_path.name)
+    else:
+        extraction = extract_summary_with_pdfplumber(pdf_path)
     if not extraction:
         return None
 
@@ -514,6 +610,7 @@ def extract_and_unify(
     Extract and unify data from any supported insurance PDF.
 
     Auto-detects source if not specified by checking PDF content.
+    The PDF is opened once and shared by detection and extraction.
 
     Args:
         pdf_path: Path to the PDF file
@@ -531,37 +628,125 @@ def extract_and_unify(
         df = extract_and_unify("uv_doc.pdf", source=InsuranceSource.UV)
         df = extract_and_unify("assomption_doc.pdf", source="Assomption")
     """
-    pdf_path = Path(pdf_path)
+    import pdfplumber
+
+    # Batch callers already pass Path / InsuranceSource objects
+    if not isinstance(pdf_path, Path):
+        pdf_path = Path(pdf_path)
 
     # Convert string source to enum if needed
-    if isinstance(source, str):
+    if source is not None and not isinstance(source, InsuranceSource):
         source = InsuranceSource(source)
 
-    # Auto-detect source if not specified
-    if source is None:
-        source = detect_source(pdf_path)
+    # Auto-detect source if not specified; like detect_source, an unreadable
+    # file is then reported as a warning rather than raised
+    auto_detect = source is None
+
+    # Try the raw-bytes detection first, it does not need a parsed PDF
+    if auto_detect:
+        source = _detect_source_from_bytes(pdf_path)
+
+    pdf = None
+    try:
+        pdf = pdfplumber.open(pdf_path)
         if source is None:
-            print(f"Warning: Could not auto-detect source for {pdf_path.name}")
+            source = detect_source_from_pdf(pdf)
+    except Exception as e:
+        if not auto_detect:
+            raise
+        print(f"Warning: Error detecting source for {pdf_path.name}: {e}")
+        source = None
+
+    if source is None:
+        if pdf is not None:
+            pdf.close()
+        print(f"Warning: Could not auto-detect source for {pdf_path.name}")
+        return None
+
+    with pdf:
+        # Extract based on source
+        if source == InsuranceSource.UV:
+            return extract_and_unify_uv(pdf_path, pdf=pdf)
+        elif source == InsuranceSource.ASSOMPTION:
+            return extract_and_unify_assomption(pdf_path, pdf=pdf)
+        else:
+            print(f"Warning: Unknown source type: {source}")
             return None
 
-    # Extract based on source
-    if source == InsuranceSource.UV:
-        return extract_and_unify_uv(pdf_path)
-    elif source == InsuranceSource.ASSOMPTION:
-        return extract_and_unify_assomption(pdf_path)
-    else:
-        print(f"Warning: Unknown source type: {source}")
+
+# Text signature identifying each source on its summary page
+_SOURCE_SIGNATURES = {
+    "SOMMAIRE DES PROTECTIONS ET DES PRIMES": InsuranceSource.UV,
+    "Sommaire des garanties": InsuranceSource.ASSOMPTION,
+}
+
+# All signatures in one alternation, so a page is scanned once whatever the number of sources
+_SIGNATURE_RE = re.compile("|".join(map(re.escape, _SOURCE_SIGNATURES)))
+_SIGNATURE_BYTES_RE = re.compile(
+    b"|".join(re.escape(sig.encode("latin-1")) for sig in _SOURCE_SIGNATURES)
+)
+
+# Bytes of the raw file scanned for source signatures before opening pdfplumber
+_DETECT_PREFIX_BYTES = 256 * 1024
+
+
+def _detect_source_from_bytes(pdf_path: Path) -> InsuranceSource | None:
+    """
+    Look for the source signatures in the raw bytes at the start of the file.
+
+    Signatures stored as uncompressed text show up in the raw bytes, which
+    avoids parsing the PDF at all. Compressed content streams will not match.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Detected InsuranceSource or None if no signature was found
+    """
+    try:
+        with open(pdf_path, "rb") as f:
+            head = f.read(_DETECT_PREFIX_BYTES)
+    except OSError:
         return None
 
+    match = _SIGNATURE_BYTES_RE.search(head)
+    if match:
+        return _SOURCE_SIGNATURES[match.group().decode("latin-1")]
 
-def detect_source(pdf_path: Path) -> InsuranceSource | None:
+    return None
+
+
+def detect_source_from_pdf(pdf: pdfplumber.PDF) -> InsuranceSource | None:
     """
-    Auto-detect the insurance source by examining PDF content.
+    Auto-detect the insurance source from an already opened PDF.
 
     Detection rules:
     - UV: Contains "SOMMAIRE DES PROTECTIONS ET DES PRIMES"
     - Assomption: Contains "Sommaire des garanties"
 
+    Args:
+        pdf: Open pdfplumber PDF object
+
+    Returns:
+        Detected InsuranceSource or None if unknown
+    """
+    for page in pdf.pages[:3]:  # Check first 3 pages
+        text = page.extract_text() or ""
+
+        match = _SIGNATURE_RE.search(text)
+        if match:
+            return _SOURCE_SIGNATURES[match.group()]
+
+    return None
+
+
+def detect_source(pdf_path: Path) -> InsuranceSource | None:
+    """
+    Auto-detect the insurance source by examining PDF content.
+
+    Checks the raw bytes first, then opens the PDF and scans the text of
+    the first pages (see detect_source_from_pdf).
+
     Args:
         pdf_path: Path to the PDF file
 
@@ -570,17 +755,13 @@ def detect_source(pdf_path: Path) -> InsuranceSource | None:
     """
     import pdfplumber
 
+    source = _detect_source_from_bytes(pdf_path)
+    if source is not None:
+        return source
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages[:3]:  # Check first 3 pages
-                text = page.extract_text() or ""
-
-                if "SOMMAIRE DES PROTECTIONS ET DES PRIMES" in text:
-                    return InsuranceSource.UV
-
-                if "Sommaire des garanties" in text:
-                    return InsuranceSource.ASSOMPTION
-
+            return detect_source_from_pdf(pdf)
     except Exception as e:
         print(f"Warning: Error detecting source for {pdf_path.name}: {e}")
 
@@ -592,13 +773,52 @@ def detect_source(pdf_path: Path) -> InsuranceSource | None:
 # =============================================================================
 
 
-def process_directory(
+# Number of per-file progress lines buffered before printing
+_PROGRESS_BATCH_SIZE = 20
+
+
+def _find_pdf_files(directory: Path, recursive: bool = False) -> list[Path]:
+    """
+    List the PDF files of a directory, sorted by path.
+
+    Uses os.scandir so names are filtered from the directory entries
+    without a stat call or a Path object per entry.
+
+    Args:
+        directory: Directory to scan
+        recursive: If True, also scan subdirectories
+
+    Returns:
+        Sorted list of PDF file paths (".pdf" suffix, any case)
+    """
+    pdf_paths = []
+    pending = [directory]
+
+    while pending:
+        # Like Path.glob, a missing or unreadable directory is skipped, not raised
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    pdf_paths.append(entry.path)
+
+    return [Path(path) for path in sorted(pdf_paths)]
+
+
+def _collect_dfs(
     directory: str | Path,
     source: InsuranceSource | str | None = None,
     recursive: bool = False,
-) -> pd.DataFrame:
+) -> tuple[list[pd.DataFrame], int]:
     """
-    Process all PDF files in a directory and return unified DataFrame.
+    Extract every PDF file in a directory without combining the results.
 
     Args:
         directory: Directory containing PDF files
@@ -606,46 +826,87 @@ def process_directory(
         recursive: If True, search subdirectories
 
     Returns:
-        Combined DataFrame from all processed PDFs
+        Tuple of (per-file DataFrames in file order, number of failed files)
     """
     directory = Path(directory)
 
-    if recursive:
-        pdf_files = list(directory.rglob("*.pdf"))
-    else:
-        pdf_files = list(directory.glob("*.pdf"))
+    pdf_files = _find_pdf_files(directory, recursive=recursive)
 
     if not pdf_files:
         print(f"No PDF files found in {directory}")
-        return pd.DataFrame(columns=UNIFIED_COLUMNS)
+        return [], 0
 
-    all_dfs = []
+    results = {}
     success_count = 0
     fail_count = 0
+    total = len(pdf_files)
+    progress_lines = []
+
+    # PDFs are independent and parsing is CPU-bound: one worker process per core
+    cpu_count = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    with ProcessPoolExecutor(max_workers=min(cpu_count, total)) as executor:
+        futures = {
+            executor.submit(extract_and_unify, pdf_path, source): pdf_path
+            for pdf_path in pdf_files
+        }
 
-    for pdf_path in sorted(pdf_files):
-        print(f"Processing: {pdf_path.name}...", end=" ")
+        for done, future in enumerate(as_completed(futures), start=1):
+            pdf_path = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                df = None
+                status = f"FAILED ({e})"
+            else:
+                status = "FAILED"
+
+            if df is not None and not df.empty:
+                results[pdf_path] = df
+                success_count += 1
+                status = f"OK ({len(df)} protections)"
+            else:
+                fail_count += 1
+
+            # Progress is written in batches rather than one flush per file
+            progress_lines.append(f"[{done}/{total}] {pdf_path.name}... {status}")
+            if len(progress_lines) >= _PROGRESS_BATCH_SIZE or done == total:
+                print("\n".join(progress_lines))
+                progress_lines.clear()
 
-        df = extract_and_unify(pdf_path, source=source)
+    print(f"\nProcessed: {success_count} success, {fail_count} failed")
 
-        if df is not None and not df.empty:
-            all_dfs.append(df)
-            success_count += 1
-            print(f"OK ({len(df)} protections)")
-        else:
-            fail_count += 1
-            print("FAILED")
+    # Keep file order stable regardless of completion order
+    return [results[pdf_path] for pdf_path in pdf_files if pdf_path in results], fail_count
 
-    print(f"\nProcessed: {success_count} success, {fail_count} failed")
+
+def process_directory(
+    directory: str | Path,
+    source: InsuranceSource | str | None = None,
+    recursive: bool = False,
+) -> pd.DataFrame:
+    """
+    Process all PDF files in a directory and return unified DataFrame.
+
+    Args:
+        directory: Directory containing PDF files
+        source: Source type or None for auto-detect
+        recursive: If True, search subdirectories
+
+    Returns:
+        Combined DataFrame from all processed PDFs
+    """
+    import pandas as pd
+
+    all_dfs, fail_count = _collect_dfs(directory, source=source, recursive=recursive)
 
     if not all_dfs:
-        return pd.DataFrame(columns=UNIFIED_COLUMNS)
+        return _empty_unified_dataframe()
 
     # Combine all DataFrames
     combined = pd.concat(all_dfs, ignore_index=True)
 
     # Store summary in attrs
-    combined.attrs["files_processed"] = success_count
+    combined.attrs["files_processed"] = len(all_dfs)
     combined.attrs["files_failed"] = fail_count
     combined.attrs["total_protections"] = len(combined)
 
@@ -666,6 +927,9 @@ def process_all_sources(
     Returns:
         Combined unified DataFrame from all sources
     """
+    import pandas as pd
+
+    # Per-file frames from both sources, combined by a single concat
     all_dfs = []
 
     if uv_directory:
@@ -674,9 +938,8 @@ def process_all_sources(
             print("\n" + "=" * 60)
             print("Processing UV PDFs")
             print("=" * 60)
-            uv_df = process_directory(uv_dir, source=InsuranceSource.UV)
-            if not uv_df.empty:
-                all_dfs.append(uv_df)
+            uv_dfs, _ = _collect_dfs(uv_dir, source=InsuranceSource.UV)
+            all_dfs.extend(uv_dfs)
 
     if assomption_directory:
         assomption_dir = Path(assomption_directory)
@@ -684,17 +947,16 @@ def process_all_sources(
             print("\n" + "=" * 60)
             print("Processing Assomption PDFs")
             print("=" * 60)
-            assomption_df = process_directory(assomption_dir, source=InsuranceSource.ASSOMPTION)
-            if not assomption_df.empty:
-                all_dfs.append(assomption_df)
+            assomption_dfs, _ = _collect_dfs(assomption_dir, source=InsuranceSource.ASSOMPTION)
+            all_dfs.extend(assomption_dfs)
 
     if not all_dfs:
-        return pd.DataFrame(columns=UNIFIED_COLUMNS)
+        return _empty_unified_dataframe()
 
     combined = pd.concat(all_dfs, ignore_index=True)
 
     # Calculate summary statistics
-    combined.attrs["total_files"] = sum(df.attrs.get("files_processed", 0) for df in all_dfs)
+    combined.attrs["total_files"] = len(all_dfs)
     combined.attrs["total_protections"] = len(combined)
 
     return combined
@@ -715,6 +977,8 @@ def generate_summary_report(df: pd.DataFrame) -> str:
     Returns:
         Formatted report string
     """
+    import pandas as pd
+
     if df.empty:
         return "No data to report."
 
@@ -737,31 +1001,32 @@ def generate_summary_report(df: pd.DataFrame) -> str:
     lines.append("")
     lines.append("BY SOURCE")
     lines.append("-" * 40)
-    source_counts = df.groupby("insurer_name").agg({
-        "pdf_filename": "nunique",
-        "product_name": "count",
-        "policy_premium": "sum",
-    }).rename(columns={
-        "pdf_filename": "PDFs",
-        "product_name": "Protections",
-        "policy_premium": "Total Annual Premium",
-    })
-
-    for source, row in source_counts.iterrows():
+    # A handful of insurers at most: plain masks are cheaper than a groupby
+    insurers = df["insurer_name"].to_numpy()
+    for source in INSURER_CATEGORIES:
+        mask = insurers == source
+        protection_count = int(mask.sum())
+        if not protection_count:
+            continue
+
+        source_df = df.loc[mask]
+        annual_premium = source_df["policy_premium"].sum()
+
         lines.append(f"  {source}:")
-        lines.append(f"    PDFs: {int(row['PDFs'])}")
-        lines.append(f"    Protections: {int(row['Protections'])}")
-        if pd.notna(row["Total Annual Premium"]):
-            lines.append(f"    Total Annual Premium: ${row['Total Annual Premium']:,.2f}")
+        lines.append(f"    PDFs: {source_df['pdf_filename'].nunique()}")
+        lines.append(f"    Protections: {protection_count}")
+        if pd.notna(annual_premium):
+            lines.append(f"    Total Annual Premium: ${annual_premium:,.2f}")
 
     # Financial summary
     lines.append("")
     lines.append("FINANCIAL SUMMARY")
     lines.append("-" * 40)
 
-    total_coverage = df["coverage_amount"].sum()
-    total_annual = df["policy_premium"].sum()
-    total_monthly = df["monthly_premium"].sum()
+    # One reduction over the numeric block instead of three column scans
+    total_coverage, total_annual, total_monthly = df[
+        ["coverage_amount", "policy_premium", "monthly_premium"]
+    ].sum()
 
     if pd.notna(total_coverage):
         lines.append(f"  Total Coverage Amount: ${total_coverage:,.2f}")
@@ -793,7 +1058,19 @@ def export_to_csv(df: pd.DataFrame, output_path: str | Path) -> Path:
         Path to saved file
     """
     output_path = Path(output_path)
-    df.to_csv(output_path, index=False, encoding="utf-8-sig")
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(output_path, index=False, encoding="utf-8-sig")
+    else:
+        # Arrow's C++ writer is much faster than to_csv; the BOM keeps Excel on UTF-8
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(output_path, "wb") as f:
+            f.write(b"\xef\xbb\xbf")
+            pacsv.write_csv(table, f)
+
     print(f"Exported to CSV: {output_path}")
     return output_path
 
@@ -809,19 +1086,39 @@ def export_to_excel(df: pd.DataFrame, output_path: str | Path) -> Path:
     Returns:
         Path to saved file
     """
+    import importlib.util
+
+    import numpy as np
+    import pandas as pd
+
     output_path = Path(output_path)
 
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        df.to_excel(writer, sheet_name="Unified Data", index=False)
+    # Column widths from cell lengths, measured in one numpy pass per column
+    widths = []
+    for col in df.columns:
+        lengths = np.char.str_len(df[col].to_numpy(dtype=str, na_value=""))
+        max_length = max(int(lengths.max()) if len(lengths) else 0, len(col)) + 2
+        widths.append(min(max_length, 50))
+
+    # xlsxwriter streams the XML instead of building an openpyxl object tree.
+    # Its constant_memory mode is not used: to_excel writes column by column,
+    # and constant_memory drops cells that are not written in row order.
+    if importlib.util.find_spec("xlsxwriter") is not None:
+        with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
+            df.to_excel(writer, sheet_name="Unified Data", index=False)
+
+            worksheet = writer.sheets["Unified Data"]
+            for idx, width in enumerate(widths):
+                worksheet.set_column(idx, idx, width)
+    else:
+        from openpyxl.utils import get_column_letter
+
+        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+            df.to_excel(writer, sheet_name="Unified Data", index=False)
 
-        # Auto-adjust column widths
-        worksheet = writer.sheets["Unified Data"]
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(col)
-            ) + 2
-            worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
+            worksheet = writer.sheets["Unified Data"]
+            for idx, width in enumerate(widths, start=1):
+                worksheet.column_dimensions[get_column_letter(idx)].width = width
 
     print(f"Exported to Excel: {output_path}")
     return output_path
@@ -832,8 +1129,14 @@ def export_to_excel(df: pd.DataFrame, output_path: str | Path) -> Path:
 # =============================================================================
 
 
+# Rows of the unified DataFrame printed by main()
+_PREVIEW_ROWS = 50
+
+
 def main():
     """Main entry point for testing unified extraction."""
+    import pandas as pd
+
     base_dir = Path(__file__).parent.parent
     uv_dir = base_dir / "pdf" / "uv"
     assomption_dir = base_dir / "pdf" / "assomption"
@@ -873,7 +1176,9 @@ def main():
         "policy_premium",
         "monthly_premium",
     ]
-    print(df.to_string(index=False))
+    print(df[display_cols].head(_PREVIEW_ROWS).to_string(index=False))
+    if len(df) > _PREVIEW_ROWS:
+        print(f"... ({len(df) - _PREVIEW_ROWS} more rows)")
 
     # Generate and print report
     print("\n" + generate_summary_report(df))
@@ -883,8 +1188,16 @@ def main():
     results_dir.mkdir(exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    export_to_csv(df, results_dir / f"unified_extraction_{timestamp}.csv")
-    export_to_excel(df, results_dir / f"unified_extraction_{timestamp}.xlsx")
+    # Both exports only read df, so they can be written side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        csv_future = executor.submit(
+            export_to_csv, df, results_dir / f"unified_extraction_{timestamp}.csv"
+        )
+        excel_future = executor.submit(
+            export_to_excel, df, results_dir / f"unified_extraction_{timestamp}.xlsx"
+        )
+        csv_future.result()
+        excel_future.result()
 
 
 if __name__ == "__main__":